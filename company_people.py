@@ -1,13 +1,13 @@
 """
 LinkedIn Company People Scraper
 Extracts visible connections (2nd-degree and public 3rd+) from a company's /people/ tab.
+Cards are read directly from the DOM; the LLM agent is only used if that finds nothing.
 
 Run: python company_people.py --url "https://www.linkedin.com/company/acme/" --save out.json
      python company_people.py --url "..." --save out.json --max-steps 120
 """
 
 import asyncio
-import json
 import argparse
 import re
 from datetime import datetime
@@ -16,17 +16,29 @@ from dotenv import load_dotenv
 
 load_dotenv()
 
-from browser_use import Agent
-from browser_use.browser.session import BrowserSession
-from browser_use.llm.google.chat import ChatGoogle
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 
-from mutual_connections import load_storage, find_free_port, _launch_browser
+from mutual_connections import (
+    load_storage, check_logged_in, save_json, _open_page, _extract, _json_blob,
+    _load_json, dedupe_people,
+)
 
-MODEL = "gemini-3-flash-preview"
+_RE_COMPANY = re.compile(r'https?://(www\.)?linkedin\.com/company/[^/?#]+')
+
+# Employee cards on the /people/ tab; the DOM scrape falls back to the agent if none match
+CARD_SELECTOR = "li.org-people-profile-card__profile-card-spacing"
+MAX_SCROLLS   = 60
+
+_CARDS_JS = """els => els.map(e => ({
+    href:   e.querySelector('a[href*="/in/"]')?.href ?? null,
+    name:   e.querySelector('.artdeco-entity-lockup__title')?.innerText ?? null,
+    title:  e.querySelector('.artdeco-entity-lockup__subtitle')?.innerText ?? null,
+    degree: e.querySelector('.distance-badge')?.innerText ?? null,
+}))"""
 
 
 def validate_company_url(url: str) -> None:
-    if not re.match(r'https?://(www\.)?linkedin\.com/company/[^/?#]+', url):
+    if not _RE_COMPANY.match(url):
         raise ValueError(
             f"Invalid LinkedIn company URL: {url!r}\n"
             "Expected format: https://www.linkedin.com/company/slug"
@@ -88,30 +100,22 @@ Step-by-step task:
 
 
 def parse_output(raw: str, company_url: str) -> dict:
-    match = re.search(r'\{[\s\S]*\}', raw)
-    if not match:
+    blob = _json_blob(raw)
+    if blob is None:
         raise RuntimeError(f"No JSON found in agent output.\nRaw output: {raw[:300]}")
     try:
-        data = json.loads(match.group())
-    except json.JSONDecodeError as e:
+        data = _load_json(blob, (
+            "company_url", "company_name", "people_tab_url", "total_employees_visible", "people",
+        ))
+    except ValueError as e:
         raise RuntimeError(f"JSON parse error: {e}\nRaw output: {raw[:300]}")
+    return normalise_people(data, company_url)
 
-    seen = set()
-    clean = []
-    for p in data.get("people", []):
-        # Normalise linkedin_url and extract linkedin_id
-        url = p.get("linkedin_url", "")
-        m = re.search(r"/in/([^/?#]+)", url)
-        if m:
-            p["linkedin_id"] = m.group(1)
-            p["linkedin_url"] = f"https://www.linkedin.com/in/{m.group(1)}"
-
-        # Skip entries with no usable identifier (no link at all)
-        uid = p.get("linkedin_id") or p.get("name")
-        if not uid or uid in seen:
-            continue
-        seen.add(uid)
 
+def normalise_people(data: dict, company_url: str) -> dict:
+    """Dedupe and normalise scraped people (agent or DOM) into {"meta", "people"}."""
+    clean = dedupe_people(data.get("people", []))
+    for p in clean:
         # Normalise degree label
         raw_degree = str(p.get("connection_degree", "unknown")).strip()
         if "1" in raw_degree:
@@ -128,8 +132,6 @@ def parse_output(raw: str, company_url: str) -> dict:
         p.setdefault("contacted", False)
         p.setdefault("contact_date", None)
 
-        clean.append(p)
-
     # Degree breakdown (recomputed — never trust agent counts)
     from collections import Counter
     by_degree = dict(Counter(p["connection_degree"] for p in clean))
@@ -148,48 +150,96 @@ def parse_output(raw: str, company_url: str) -> dict:
     return {"meta": meta, "people": clean}
 
 
-async def get_company_people(
-    company_url: str,
-    save_path: Optional[str] = None,
-    max_steps: int = 80,
-) -> dict:
-    validate_company_url(company_url)
-    print(f"\nTarget : {people_tab_url(company_url)}")
-
-    storage = load_storage()
-    pw, browser, page, port = await _launch_browser(storage)
-    llm = ChatGoogle(model=MODEL, temperature=0)
+async def scrape_people_tab(page, company_url: str) -> Optional[dict]:
+    """Read the employee cards straight from the /people/ DOM — no LLM involved.
 
+    Returns data in the same shape the agent emits, or None when no cards are
+    found (restricted tab or changed markup) so the caller can use the agent.
+    """
+    tab_url = people_tab_url(company_url)
+    await page.goto(tab_url, wait_until="domcontentloaded")
+    check_logged_in(page)
     try:
-        agent = Agent(
-            task=build_task(company_url),
-            llm=llm,
-            browser=BrowserSession(cdp_url=f"http://localhost:{port}"),
-            max_actions_per_step=15,
-        )
-        print(f"Agent starting (max_steps={max_steps})...\n")
-        result = await agent.run(max_steps=max_steps)
-        raw = result.final_result() if hasattr(result, "final_result") else str(result)
-    finally:
-        await browser.close()
-        await pw.stop()
+        await page.wait_for_selector(CARD_SELECTOR, timeout=10000)
+    except PlaywrightTimeoutError:
+        return None
+
+    # Scroll (and press "Show more results") until the page stops growing
+    prev_height = 0
+    for _ in range(MAX_SCROLLS):
+        await page.mouse.wheel(0, 8000)
+        await page.wait_for_timeout(700)
+        show_more = page.locator("button.scaffold-finite-scroll__load-button")
+        if await show_more.is_visible():
+            await show_more.click()
+            await page.wait_for_timeout(700)
+        height = await page.evaluate("document.body.scrollHeight")
+        if height == prev_height:
+            break
+        prev_height = height
+
+    cards = await page.eval_on_selector_all(CARD_SELECTOR, _CARDS_JS)
+    company_name = await page.evaluate("document.querySelector('h1')?.innerText ?? ''")
+
+    # Cards without a profile link or name ("LinkedIn Member") are skipped, as in the agent task
+    people = [
+        {
+            "name": c["name"].strip(),
+            "linkedin_url": c["href"],
+            "title": c["title"].strip() if c["title"] else None,
+            "location": None,  # not shown on /people/ cards
+            "connection_degree": c["degree"] or "unknown",
+        }
+        for c in cards
+        if c["href"] and c["name"]
+    ]
+    return {
+        "company_url": company_url.rstrip("/"),
+        "company_name": company_name.strip(),
+        "people_tab_url": tab_url,
+        "total_employees_visible": len(cards),
+        "people": people,
+    }
 
-    data = parse_output(raw, company_url)
 
+def print_summary(data: dict) -> None:
+    """Print a company people result (also used by the --use-daemon client)."""
     meta = data["meta"]
     print(f"\nCompany              : {meta.get('company_name', '?')}")
     print(f"Total visible        : {meta.get('total_employees_visible', '?')}")
     print(f"Total captured       : {meta.get('total_captured', '?')}")
     for degree, count in sorted(meta.get("by_degree", {}).items()):
         print(f"  {degree:<8}           : {count}")
-
     for i, person in enumerate(data["people"], 1):
         deg = person.get("connection_degree", "?")
         print(f"  {i:3}. [{deg}] {person['name']:<32} {person.get('linkedin_url', '')}")
 
+
+async def get_company_people(
+    company_url: str,
+    save_path: Optional[str] = None,
+    max_steps: int = 80,
+    context=None,
+    port: Optional[int] = None,
+) -> dict:
+    validate_company_url(company_url)
+    print(f"\nTarget : {people_tab_url(company_url)}")
+
+    storage = load_storage()
+    async with _open_page(storage, context, port) as (page, port):
+        data = await scrape_people_tab(page, company_url)
+        if data is not None:
+            print(f"DOM scrape found {data['total_employees_visible']} employee cards")
+            data = normalise_people(data, company_url)
+        else:
+            print("No employee cards in the DOM — falling back to the agent.")
+            print(f"Agent starting (max_steps={max_steps})...\n")
+            data = await _extract(build_task(company_url), port, max_steps,
+                                  lambda raw: parse_output(raw, company_url), page=page)
+
+    print_summary(data)
     if save_path:
-        with open(save_path, "w") as f:
-            json.dump(data, f, indent=2)
+        save_json(data, save_path)
         print(f"\nSaved to {save_path}")
 
     return data
@@ -202,8 +252,16 @@ def main():
     parser.add_argument("--url",       required=True,  help="LinkedIn company URL")
     parser.add_argument("--save",      default=None,   help="Save results to JSON file")
     parser.add_argument("--max-steps", default=80,     type=int,
-                        help="Max agent steps (default 80; use 120+ for large companies)")
+                        help="Max agent steps if the DOM scrape falls back to the agent "
+                             "(default 80; use 120+ for large companies)")
+    parser.add_argument("--use-daemon", action="store_true",
+                        help="Run on a warm linkedin_daemon.py instead of launching a browser")
     args = parser.parse_args()
+    if args.use_daemon:
+        from linkedin_daemon import run_via_daemon
+        asyncio.run(run_via_daemon("company_people", args.save, print_summary,
+                                   url=args.url, max_steps=args.max_steps))
+        return
     asyncio.run(get_company_people(args.url, args.save, args.max_steps))
 
 
@@ -7,22 +7,17 @@ Run: python contact_info.py --url "https://www.linkedin.com/in/username/"
 """
 
 import asyncio
-import json
 import argparse
-import re
 from datetime import datetime
 from typing import Optional
 from dotenv import load_dotenv
 
 load_dotenv()
 
-from browser_use import Agent
-from browser_use.browser.session import BrowserSession
-from browser_use.llm.google.chat import ChatGoogle
-
-from mutual_connections import load_storage, _launch_browser, validate_linkedin_url
-
-MODEL = "gemini-3-flash-preview"
+from mutual_connections import (
+    load_storage, save_json, _open_page, _extract, _json_blob, _load_json,
+    normalise_profile_url, validate_linkedin_url,
+)
 
 
 def contact_overlay_url(profile_url: str) -> str:
@@ -83,12 +78,12 @@ Put any extra fields not listed above into "other" as key-value string pairs.
 
 
 def parse_output(raw: str) -> dict:
-    match = re.search(r"\{[\s\S]*\}", raw)
-    if not match:
+    blob = _json_blob(raw)
+    if blob is None:
         raise RuntimeError(f"No JSON found in agent output.\nRaw: {raw[:300]}")
     try:
-        data = json.loads(match.group())
-    except json.JSONDecodeError as e:
+        data = _load_json(blob)
+    except ValueError as e:
         raise RuntimeError(f"JSON parse error: {e}\nRaw: {raw[:300]}")
 
     # Always stamp extraction time ourselves
@@ -97,9 +92,9 @@ def parse_output(raw: str) -> dict:
     # Normalise linkedin_url
     li = data.get("linkedin_url")
     if li:
-        m = re.search(r"/in/([^/?#]+)", li)
-        if m:
-            data["linkedin_url"] = f"https://www.linkedin.com/in/{m.group(1)}"
+        _, url = normalise_profile_url(li)
+        if url:
+            data["linkedin_url"] = url
 
     # Guarantee phones is a list of dicts
     phones = data.get("phones")
@@ -134,34 +129,8 @@ def parse_output(raw: str) -> dict:
     return data
 
 
-async def get_contact_info(
-    profile_url: str,
-    save_path: Optional[str] = None,
-    max_steps: int = 20,
-) -> dict:
-    validate_linkedin_url(profile_url)
-    print(f"\nTarget : {contact_overlay_url(profile_url)}")
-
-    storage = load_storage()
-    pw, browser, page, port = await _launch_browser(storage)
-    llm = ChatGoogle(model=MODEL, temperature=0)
-
-    try:
-        agent = Agent(
-            task=build_task(profile_url),
-            llm=llm,
-            browser=BrowserSession(cdp_url=f"http://localhost:{port}"),
-            max_actions_per_step=10,
-        )
-        print(f"Agent starting (max_steps={max_steps})...\n")
-        result = await agent.run(max_steps=max_steps)
-        raw = result.final_result() if hasattr(result, "final_result") else str(result)
-    finally:
-        await browser.close()
-        await pw.stop()
-
-    data = parse_output(raw)
-
+def print_summary(data: dict) -> None:
+    """Print a contact info result (also used by the --use-daemon client)."""
     if data.get("access_restricted"):
         print("Access restricted — must be connected to see contact info.")
     else:
@@ -176,9 +145,27 @@ async def get_contact_info(
         if data.get("other"):
             print(f"Other fields   : {list(data['other'].keys())}")
 
+
+async def get_contact_info(
+    profile_url: str,
+    save_path: Optional[str] = None,
+    max_steps: int = 20,
+    context=None,
+    port: Optional[int] = None,
+) -> dict:
+    validate_linkedin_url(profile_url)
+    print(f"\nTarget : {contact_overlay_url(profile_url)}")
+
+    storage = load_storage()
+    async with _open_page(storage, context, port) as (page, port):
+        print(f"Agent starting (max_steps={max_steps})...\n")
+        data = await _extract(build_task(profile_url), port, max_steps, parse_output,
+                              max_actions_per_step=10, page=page)
+
+    print_summary(data)
+
     if save_path:
-        with open(save_path, "w") as f:
-            json.dump(data, f, indent=2)
+        save_json(data, save_path)
         print(f"\nSaved to {save_path}")
 
     return data
@@ -193,7 +180,16 @@ def main():
     parser.add_argument(
         "--max-steps", default=20, type=int, help="Max agent steps (default 20)"
     )
+    parser.add_argument(
+        "--use-daemon", action="store_true",
+        help="Run on a warm linkedin_daemon.py instead of launching a browser",
+    )
     args = parser.parse_args()
+    if args.use_daemon:
+        from linkedin_daemon import run_via_daemon
+        asyncio.run(run_via_daemon("contact_info", args.save, print_summary,
+                                   url=args.url, max_steps=args.max_steps))
+        return
     asyncio.run(get_contact_info(args.url, args.save, args.max_steps))
 
 
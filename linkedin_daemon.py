@@ -0,0 +1,200 @@
+"""
+LinkedIn Scraper Daemon
+Keeps one warm Chromium with a pool of logged-in browser contexts, so CLI runs
+skip the cold start, cookie injection and session check. Jobs arrive as one JSON
+line over a Unix socket; the scrapers send them when run with --use-daemon.
+
+Run: python linkedin_daemon.py
+     python linkedin_daemon.py --pool 3 --socket /tmp/linkedin_daemon.sock
+Then: python mutual_connections.py --url "..." --use-daemon
+"""
+
+import asyncio
+import argparse
+import os
+from contextlib import asynccontextmanager, suppress
+from pathlib import Path
+from typing import Optional
+import orjson
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from mutual_connections import (
+    load_storage, save_json, find_free_port, _launch_browser, _new_context,
+    get_mutual_connections,
+)
+from company_people import get_company_people
+from contact_info import get_contact_info
+
+SOCKET_PATH   = os.getenv("LINKEDIN_DAEMON_SOCKET", "/tmp/linkedin_daemon.sock")
+POOL_SIZE     = int(os.getenv("LINKEDIN_DAEMON_POOL", "2"))
+# CDP port for the daemon's browser; 0 picks a free one once at startup
+CDP_PORT      = int(os.getenv("LINKEDIN_DAEMON_CDP_PORT", "0"))
+# Contexts are replaced after this many jobs to bound per-context memory growth
+RECYCLE_AFTER = 20
+# Results for big company scrapes easily exceed asyncio's 64 KiB line default
+STREAM_LIMIT  = 64 * 1024 * 1024
+
+
+class ContextPool:
+    """Fixed pool of cookie-carrying BrowserContexts handed out one job at a time."""
+
+    def __init__(self, browser, storage: dict, size: int, recycle_after: int = RECYCLE_AFTER):
+        self.browser = browser
+        self.storage = storage
+        self.size = size
+        self.recycle_after = recycle_after
+        self._queue: asyncio.Queue = asyncio.Queue()
+
+    async def _new(self):
+        # Unrouted so the HTTP cache stays warm across jobs (see _new_context)
+        return await _new_context(self.browser, self.storage, block_resources=False)
+
+    async def start(self) -> None:
+        for _ in range(self.size):
+            self._queue.put_nowait((await self._new(), 0))
+
+    @asynccontextmanager
+    async def checkout(self):
+        context, uses = await self._queue.get()
+        try:
+            if context is None:
+                context, uses = await self._new(), 0
+            yield context
+        finally:
+            context, uses = await self._reset(context, uses + 1)
+            # Always hand the slot back: a lost slot shrinks the pool until jobs hang
+            self._queue.put_nowait((context, uses))
+
+    async def _reset(self, context, uses: int) -> tuple:
+        """Ready `context` for the next job, replacing it when due or when the reset fails.
+
+        Returns (None, 0) if no replacement could be made; checkout() retries then.
+        """
+        if context is None:
+            return None, 0
+        if uses < self.recycle_after:
+            try:
+                # Reset the session so one job's cookie changes never leak into the next
+                await context.clear_cookies()
+                await context.add_cookies(self.storage["cookies_clean"])
+                return context, uses
+            except Exception as exc:
+                print(f"Context reset failed ({exc}) — replacing it.")
+        with suppress(Exception):
+            await context.close()
+        try:
+            return await self._new(), 0
+        except Exception as exc:
+            print(f"New context failed ({exc}) — retrying at next checkout.")
+            return None, 0
+
+
+async def _run_job(req: dict, context, port: int) -> dict:
+    op = req.get("op")
+    if op == "mutuals":
+        return await get_mutual_connections(
+            req["url"], enrich=req.get("enrich", False), context=context, port=port
+        )
+    if op == "company_people":
+        return await get_company_people(
+            req["url"], max_steps=req.get("max_steps", 80), context=context, port=port
+        )
+    if op == "contact_info":
+        return await get_contact_info(
+            req["url"], max_steps=req.get("max_steps", 20), context=context, port=port
+        )
+    raise ValueError(f"Unknown op: {op!r}")
+
+
+async def serve(socket_path: str = SOCKET_PATH, pool_size: int = POOL_SIZE,
+                cdp_port: int = CDP_PORT) -> None:
+    # One port for the daemon's lifetime; every job's agent attaches to it
+    port = cdp_port or find_free_port()
+    storage = load_storage()
+    pw, browser, page, port = await _launch_browser(storage, port=port)
+    # Jobs only use pooled contexts; drop the launch context rather than leave it idle
+    await page.context.close()
+    pool = ContextPool(browser, storage, pool_size)
+    await pool.start()
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            req = orjson.loads(await reader.readline())
+            print(f"\nJob: {req.get('op')} {req.get('url')}")
+            async with pool.checkout() as context:
+                resp = {"ok": True, "result": await _run_job(req, context, port)}
+        except Exception as exc:
+            resp = {"ok": False, "error": str(exc)}
+        writer.write(orjson.dumps(resp) + b"\n")
+        await writer.drain()
+        writer.close()
+        await writer.wait_closed()
+
+    Path(socket_path).unlink(missing_ok=True)
+    server = await asyncio.start_unix_server(handle, path=socket_path, limit=STREAM_LIMIT)
+    print(f"Daemon ready on {socket_path} ({pool_size} contexts, CDP port {port})")
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        await browser.close()
+        await pw.stop()
+        Path(socket_path).unlink(missing_ok=True)
+
+
+async def submit(op: str, socket_path: str = SOCKET_PATH, **params) -> dict:
+    """Send one job to a running daemon and return its result."""
+    try:
+        reader, writer = await asyncio.open_unix_connection(socket_path, limit=STREAM_LIMIT)
+    except (FileNotFoundError, ConnectionRefusedError):
+        raise RuntimeError(
+            f"No daemon listening on {socket_path}.\n"
+            "Start one with: python linkedin_daemon.py"
+        )
+    writer.write(orjson.dumps({"op": op, **params}) + b"\n")
+    await writer.drain()
+    line = await reader.readline()
+    writer.close()
+    await writer.wait_closed()
+
+    resp = orjson.loads(line)
+    if not resp.get("ok"):
+        raise RuntimeError(f"Daemon job failed: {resp.get('error')}")
+    return resp["result"]
+
+
+async def run_via_daemon(op: str, save_path: Optional[str] = None,
+                         print_summary=None, **params) -> dict:
+    """CLI entry for --use-daemon: submit the job, print and save the result locally.
+
+    The job's own progress output goes to the daemon's stdout, so the calling
+    script passes its print_summary to show the result here.
+    """
+    print(f"Submitting {op} job to daemon at {SOCKET_PATH}...")
+    data = await submit(op, **params)
+    print("Done.")
+    if print_summary:
+        print_summary(data)
+    if save_path:
+        save_json(data, save_path)
+        print(f"\nSaved to {save_path}")
+    return data
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Keep a warm LinkedIn browser pool and serve scraper jobs over a Unix socket."
+    )
+    parser.add_argument("--socket", default=SOCKET_PATH, help=f"Socket path (default {SOCKET_PATH})")
+    parser.add_argument("--pool",   default=POOL_SIZE,   type=int,
+                        help=f"Number of warm browser contexts (default {POOL_SIZE})")
+    parser.add_argument("--cdp-port", default=CDP_PORT, type=int,
+                        help="Fixed CDP port for the browser (default: pick a free one)")
+    args = parser.parse_args()
+    asyncio.run(serve(args.socket, args.pool, args.cdp_port))
+
+
+if __name__ == "__main__":
+    main()
@@ -2,7 +2,7 @@
 LinkedIn Mutual Connections Agent
 Run: python mutual_connections.py --url "https://www.linkedin.com/in/someprofile/"
 Add --enrich to also fetch the latest experience entry from each profile.
-  Warning: --enrich visits every mutual profile individually — slow for large lists.
+  --enrich visits every mutual profile, MAX_PAGES (default 8) at a time.
 """
 
 import asyncio
@@ -10,31 +10,78 @@ import json
 import argparse
 import re
 import os
+import time
 from datetime import datetime
+from contextlib import asynccontextmanager
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
+import orjson
 from dotenv import load_dotenv
 
 load_dotenv()
 
 import socket
-from playwright.async_api import async_playwright
+from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeoutError
+
+try:
+    # Optional (pip install pysimdjson): lazy parsing for the known output schemas
+    import simdjson
+    _SIMDJSON_PARSER = simdjson.Parser()
+except ImportError:
+    simdjson = None
 
 from browser_use import Agent
+from browser_use.browser.events import SwitchTabEvent
 from browser_use.browser.session import BrowserSession
 from browser_use.llm.google.chat import ChatGoogle
 
 
 STORAGE_FILE = "linkedin_storage.json"
-MODEL        = "gemini-3-flash-preview"
+# Scraping is "read the page, emit JSON" — a light model handles it; the larger
+# one is only used to retry when the light model's output can't be parsed
+EXTRACTOR_MODEL = os.getenv("EXTRACTOR_MODEL", "gemini-2.5-flash-lite")
+PLANNER_MODEL   = os.getenv("PLANNER_MODEL", "gemini-3-flash-preview")
 # Set HEADLESS=false in .env to see the browser locally; VMs always run headless
 HEADLESS     = os.getenv("HEADLESS", "false").lower() != "false"
+# Process-wide caps (shared by every scrape in a daemon). browser-use Agents are
+# RAM-heavy and contend on one event bus, so few run at once; plain Playwright
+# page loads are cheap and can go wider.
+AGENT_SEM = asyncio.Semaphore(int(os.getenv("MAX_AGENTS", "3")))
+PAGE_SEM  = asyncio.Semaphore(int(os.getenv("MAX_PAGES", "8")))
+# Profiles per enrich agent — keeps each prompt small and a failure local to its batch
+ENRICH_BATCH_SIZE = 10
+
+# Topmost Experience entry on a profile page, read directly for --enrich
+EXPERIENCE_SELECTOR = "div#experience ~ div ul > li"
+_EXPERIENCE_JS = """el => {
+    const text = (root, sel) => root.querySelector(`${sel} span[aria-hidden="true"]`)?.innerText ?? null;
+    const caption = root => [...root.querySelectorAll('.t-14.t-normal.t-black--light span[aria-hidden="true"]')]
+                              .map(s => s.innerText);
+    // Several roles at one company are grouped: the header's bold line is the
+    // company and each nested <li> is a role with its own title and dates
+    const role = [...el.querySelectorAll('ul li')].find(li => li.querySelector('.t-bold'));
+    if (role) {
+        return {title: text(role, '.t-bold'), company: text(el, '.t-bold'), caption: caption(role)};
+    }
+    return {
+        title:   text(el, '.t-bold'),
+        company: text(el, '.t-14.t-normal:not(.t-black--light)'),
+        caption: caption(el),
+    };
+}"""
+
+_RE_PROFILE = re.compile(r'https?://(www\.)?linkedin\.com/in/[^/?#]+')
+_RE_IN_SLUG = re.compile(r"/in/([^/?#]+)")
+# Where LinkedIn bounces requests from a revoked or challenged session
+_RE_LOGGED_OUT = re.compile(r"linkedin\.com/(login|authwall|checkpoint|uas/login)")
 
 
 def find_free_port() -> int:
     with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-        s.bind(('', 0))
+        # Must precede bind() to have any effect on TIME_WAIT reuse
         s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        s.bind(('', 0))
         return s.getsockname()[1]
 
 
@@ -46,11 +93,88 @@ def load_storage() -> dict:
         )
     with open(path) as f:
         storage = json.load(f)
-    cookie_count = len(storage.get("cookies", []))
-    print(f"Loaded {cookie_count} session cookies")
+    # Clean once here so every context launch can pass the list straight to
+    # add_cookies (which rejects dict-valued partitionKeys); the raw list is dropped
+    storage["cookies_clean"] = [
+        {k: v for k, v in c.items() if k != "partitionKey" or isinstance(v, str)}
+        for c in storage.pop("cookies", [])
+    ]
+    print(f"Loaded {len(storage['cookies_clean'])} session cookies")
     return storage
 
 
+def save_json(data: dict, path: str) -> None:
+    """Write results as indented JSON, serialised in one orjson call."""
+    with open(path, "wb") as f:
+        f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+
+
+class JsonStreamWriter:
+    """Write {**head, key: [item, ...]} to `path` one item at a time.
+
+    Each item is flushed as soon as it's written, so a run that dies part-way
+    (crash, captcha) still leaves every finished item on disk. close() ends
+    the array; used as a context manager it also runs on errors, which keeps
+    the file valid JSON.
+    """
+
+    def __init__(self, path: str, head: dict, key: str):
+        self._f = open(path, "wb")
+        prefix = orjson.dumps(head, option=orjson.OPT_NON_STR_KEYS)[:-1]
+        self._f.write(prefix + (b"," if head else b"") + orjson.dumps(key) + b":[")
+        self._first = True
+
+    def write(self, item: dict) -> None:
+        self._f.write(b"\n  " if self._first else b",\n  ")
+        self._f.write(orjson.dumps(item, option=orjson.OPT_NON_STR_KEYS))
+        self._f.flush()
+        self._first = False
+
+    def close(self) -> None:
+        if not self._f.closed:
+            self._f.write(b"\n]}\n")
+            self._f.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def check_session(storage: dict) -> None:
+    """Raise RuntimeError unless the saved session has a live li_at auth cookie.
+
+    Checked offline from the cookie's expiry instead of loading the feed, which
+    cost a full page render per run.
+    """
+    li_at = next((c for c in storage["cookies_clean"] if c.get("name") == "li_at"), None)
+    # Playwright stores session-only cookies with expires == -1
+    expires = li_at.get("expires", -1) if li_at else 0
+    if li_at is None or 0 <= expires < time.time():
+        raise RuntimeError(
+            "LinkedIn session cookie (li_at) is missing or expired.\n"
+            "Re-run: python save_cookies.py"
+        )
+
+
+class SessionExpiredError(RuntimeError):
+    """LinkedIn redirected to login/authwall/checkpoint: the saved session is dead."""
+
+
+def check_logged_in(page) -> None:
+    """Raise SessionExpiredError if `page` was bounced off LinkedIn's auth wall.
+
+    check_session() only sees the cookie's expiry; a session revoked server-side
+    still looks live until a page load lands here.
+    """
+    if _RE_LOGGED_OUT.search(page.url):
+        raise SessionExpiredError(
+            f"LinkedIn redirected to {page.url} — the saved session is no longer valid.\n"
+            "Re-run: python save_cookies.py"
+        )
+
+
 def build_task(profile_url: str) -> str:
     return f"""
 You are helping extract mutual connections from a LinkedIn profile.
@@ -95,8 +219,9 @@ Step-by-step task:
 
 
 def build_enrich_task(profiles: list[dict]) -> str:
+    # ids appear once, in the url list — the JSON template below is a fixed-size
+    # example, so the prompt grows O(profiles) rather than listing every id twice
     url_list = "\n".join(f'- {p["linkedin_url"]}  (id: {p["linkedin_id"]})' for p in profiles)
-    ids = [p["linkedin_id"] for p in profiles]
     return f"""
 You are enriching LinkedIn profiles with their latest work experience.
 The user is already logged in via session cookies.
@@ -115,37 +240,91 @@ Visit each LinkedIn profile URL below ONE BY ONE. For each profile:
 Profiles to visit:
 {url_list}
 
-After visiting ALL profiles return ONLY this JSON, nothing else:
+After visiting ALL profiles return ONLY a JSON object keyed by each id above, nothing else:
 {{
-{chr(10).join(f'  "{lid}": {{"job_title": "...", "company": "...", "start_date": "...", "end_date": "...", "location": "..."}},' for lid in ids)}
+  "<id1>": {{"job_title": "...", "company": "...", "start_date": "...", "end_date": "...", "location": "..."}},
+  "<id2>": {{"job_title": "...", "company": "...", "start_date": "...", "end_date": "...", "location": "..."}}
 }}
 
-Use null for any field not visible on the page.
+Repeat the entry for every id in the list. Use null for any field not visible on the page.
 """
 
 
+@lru_cache(maxsize=8192)
+def normalise_profile_url(url: str) -> tuple[Optional[str], Optional[str]]:
+    """(linkedin_id, canonical profile URL) for any /in/<slug> URL, else (None, None).
+
+    Cached because the same people recur across scrapes in a long-lived daemon.
+    """
+    m = _RE_IN_SLUG.search(url)
+    if not m:
+        return None, None
+    return m.group(1), f"https://www.linkedin.com/in/{m.group(1)}"
+
+
+def dedupe_people(people: list[dict]) -> list[dict]:
+    """Drop repeat and unidentifiable people, canonicalising linkedin_id/linkedin_url."""
+    # One pass: dict keyed by id dedupes and keeps first-seen order
+    by_id = {}
+    for p in people:
+        lid, url = normalise_profile_url(p.get("linkedin_url") or "")
+        uid = lid or p.get("linkedin_id") or p.get("name")
+        if not uid or uid in by_id:
+            continue
+        if lid:
+            p["linkedin_id"] = lid
+            p["linkedin_url"] = url
+        by_id[uid] = p
+    return list(by_id.values())
+
+
+def _json_blob(raw: str) -> Optional[str]:
+    r"""Outermost {...} span in agent output, or None.
+
+    Same span a greedy r'\{[\s\S]*\}' search matches, found with two scans
+    instead of a backtracking regex over the whole output.
+    """
+    start = raw.find("{")
+    end = raw.rfind("}")
+    return raw[start:end + 1] if start >= 0 and end > start else None
+
+
+def _load_json(blob: str, fields: Optional[tuple[str, ...]] = None) -> dict:
+    """Decode an agent JSON object, keeping only top-level `fields` if given.
+
+    With pysimdjson installed, fields outside `fields` are never turned into
+    Python objects; otherwise orjson decodes everything. Raises ValueError on
+    malformed JSON either way.
+    """
+    if fields is None:
+        return orjson.loads(blob)
+    if simdjson is not None:
+        doc = _SIMDJSON_PARSER.parse(blob.encode())
+        data = {}
+        for k in fields:
+            if k not in doc:
+                continue
+            v = doc[k]
+            if isinstance(v, simdjson.Object):
+                v = v.as_dict()
+            elif isinstance(v, simdjson.Array):
+                v = v.as_list()
+            data[k] = v
+        return data
+    data = orjson.loads(blob)
+    return {k: data[k] for k in fields if k in data}
+
+
 def parse_output(raw: str, profile_url: str) -> dict:
-    match = re.search(r'\{[\s\S]*\}', raw)
-    if not match:
+    blob = _json_blob(raw)
+    if blob is None:
         return {"error": "No JSON found", "raw": raw}
     try:
-        data = json.loads(match.group())
-    except json.JSONDecodeError as e:
+        data = _load_json(blob, ("target_profile", "mutual_count", "mutual_connections"))
+    except ValueError as e:
         return {"error": str(e), "raw": raw}
 
-    seen = set()
-    clean = []
-    for p in data.get("mutual_connections", []):
-        url = p.get("linkedin_url", "")
-        m = re.search(r"/in/([^/?#]+)", url)
-        if m:
-            p["linkedin_id"] = m.group(1)
-            p["linkedin_url"] = f"https://www.linkedin.com/in/{m.group(1)}"
-        uid = p.get("linkedin_id") or p.get("name")
-        if uid and uid not in seen:
-            seen.add(uid)
-            clean.append(p)
-
+    clean = dedupe_people(data.get("mutual_connections", []))
     data["mutual_connections"] = clean
     data["actual_extracted"] = len(clean)
     data["extracted_at"] = datetime.utcnow().isoformat() + "Z"
@@ -153,18 +332,65 @@ def parse_output(raw: str, profile_url: str) -> dict:
 
 
 def parse_enrich_output(raw: str) -> dict:
-    match = re.search(r'\{[\s\S]*\}', raw)
-    if not match:
+    blob = _json_blob(raw)
+    if blob is None:
         return {}
     try:
-        return json.loads(match.group())
-    except json.JSONDecodeError:
+        return _load_json(blob)
+    except ValueError:
         return {}
 
 
-async def _launch_browser(storage: dict):
-    """Launch Playwright browser with LinkedIn session. Returns (pw, browser, page, port)."""
-    port = find_free_port()
+# Never read by the agent or the DOM scrapes — aborting them cuts most of the bytes per page
+_BLOCKED_RESOURCES = {"image", "media", "font"}
+_BLOCKED_URL_PARTS = ("/li/track", "px.ads.linkedin.com")
+
+
+async def _block_unneeded(route) -> None:
+    request = route.request
+    if request.resource_type in _BLOCKED_RESOURCES or any(
+        part in request.url for part in _BLOCKED_URL_PARTS
+    ):
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+async def _new_context(browser, storage: dict, block_resources: bool = True):
+    """Open a fresh BrowserContext in `browser` carrying the LinkedIn session cookies.
+
+    block_resources aborts images, media, fonts and trackers. Playwright turns the
+    HTTP cache off for every page in a routed context, so long-lived contexts that
+    gain more from a warm cache (the daemon pool) pass False and route per page.
+    """
+    user_agent = (
+        "Mozilla/5.0 (X11; Linux x86_64) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) "
+        "Chrome/121.0.0.0 Safari/537.36"
+        if HEADLESS else
+        "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) "
+        "Chrome/121.0.0.0 Safari/537.36"
+    )
+    context = await browser.new_context(
+        viewport={"width": 1280, "height": 800},
+        user_agent=user_agent,
+    )
+
+    await context.add_cookies(storage["cookies_clean"])
+    if block_resources:
+        # Context-level, so every page opened in it (e.g. enrich tabs) is covered
+        await context.route("**/*", _block_unneeded)
+    return context
+
+
+async def _launch_browser(storage: dict, port: Optional[int] = None):
+    """Launch Playwright browser with LinkedIn session. Returns (pw, browser, page, port).
+
+    Pass `port` to pin the CDP port (the daemon does); otherwise a free one is picked.
+    """
+    check_session(storage)
+    port = port or find_free_port()
     print(f"Launching browser on port {port}...")
 
     headless_args = [
@@ -185,128 +411,315 @@ async def _launch_browser(storage: dict):
         ],
     )
 
-    page = await browser.new_page()
-    await page.set_viewport_size({"width": 1280, "height": 800})
+    page = await (await _new_context(browser, storage)).new_page()
+    print(f"Injected {len(storage['cookies_clean'])} cookies")
+    return pw, browser, page, port
 
-    user_agent = (
-        "Mozilla/5.0 (X11; Linux x86_64) "
-        "AppleWebKit/537.36 (KHTML, like Gecko) "
-        "Chrome/121.0.0.0 Safari/537.36"
-        if HEADLESS else
-        "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
-        "AppleWebKit/537.36 (KHTML, like Gecko) "
-        "Chrome/121.0.0.0 Safari/537.36"
-    )
-    await page.set_extra_http_headers({"User-Agent": user_agent})
 
-    clean_cookies = [
-        {k: v for k, v in c.items() if k != "partitionKey" or isinstance(v, str)}
-        for c in storage["cookies"]
-    ]
-    await page.context.add_cookies(clean_cookies)
-    print(f"Injected {len(storage['cookies'])} cookies")
+@asynccontextmanager
+async def _open_page(storage: dict, context=None, port: Optional[int] = None):
+    """Yield (page, port) for one scrape.
 
-    print("Verifying LinkedIn session...")
-    await page.goto("https://www.linkedin.com/feed/", wait_until="domcontentloaded", timeout=15000)
-    await asyncio.sleep(1)
-    current_url = page.url
+    Given a pooled `context` (see linkedin_daemon.py) a tab is opened in it and
+    closed afterwards; otherwise a browser is launched and torn down around it.
+    """
+    if context is not None:
+        page = await context.new_page()
+        try:
+            yield page, port
+        finally:
+            await page.close()
+        return
 
-    if "login" in current_url or "authwall" in current_url or "checkpoint" in current_url:
+    pw, browser, page, port = await _launch_browser(storage)
+    try:
+        yield page, port
+    finally:
         await browser.close()
         await pw.stop()
-        raise RuntimeError(
-            f"LinkedIn session check failed (at {current_url}).\n"
-            "Re-run: python save_cookies.py"
-        )
-    print(f"Session verified — at {current_url[:70]}")
-    return pw, browser, page, port
+
+
+def _cdp_session(port: int) -> BrowserSession:
+    """browser-use session attached to our Playwright browser over CDP.
+
+    keep_alive stops the Agent from tearing the browser down when it finishes,
+    so several agents can run against one launch. The caller owns shutdown of
+    the browser; _run_agent resets (disconnects) the session itself.
+    """
+    return BrowserSession(cdp_url=f"http://localhost:{port}", keep_alive=True)
+
+
+# New tabs open in the browser's default context, which has none of our cookies
+_STAY_IN_TAB = ("Work only in the current tab: navigate it directly and never open "
+                "a new tab — new tabs are not logged in to LinkedIn.")
+
+
+async def _target_id(page) -> str:
+    """CDP target id of a Playwright page, used to pin an agent to that tab."""
+    cdp = await page.context.new_cdp_session(page)
+    try:
+        info = await cdp.send("Target.getTargetInfo")
+    finally:
+        await cdp.detach()
+    return info["targetInfo"]["targetId"]
+
+
+async def _run_agent(task: str, port: int, max_steps: int, model: str = EXTRACTOR_MODEL,
+                     max_actions_per_step: int = 15, page=None) -> str:
+    """Run one browser-use Agent against the browser on `port`; returns its final text.
+
+    With `page`, the agent is focused on that tab (and so on its context's cookies)
+    instead of whichever tab browser-use finds first.
+    """
+    async with AGENT_SEM:
+        return await _drive_agent(task, port, max_steps, model, max_actions_per_step, page)
+
+
+async def _drive_agent(task: str, port: int, max_steps: int, model: str,
+                       max_actions_per_step: int, page=None) -> str:
+    """_run_agent's body, for callers already holding an AGENT_SEM slot.
+
+    The session, LLM client and Agent are only built here, so runs queued on
+    AGENT_SEM hold none of them while they wait.
+    """
+    session = _cdp_session(port)
+    agent = Agent(
+        task=task,
+        llm=ChatGoogle(model=model, temperature=0),
+        browser=session,
+        max_actions_per_step=max_actions_per_step,
+        extend_system_message=_STAY_IN_TAB,
+    )
+    try:
+        if page is not None:
+            target_id = await _target_id(page)
+            # start() is idempotent, so agent.run() keeps this connection and focus
+            await session.start()
+            await session.event_bus.dispatch(SwitchTabEvent(target_id=target_id))
+        result = await agent.run(max_steps=max_steps)
+    finally:
+        # keep_alive sessions outlive the Agent; reset() drops the CDP connection
+        # and watchdogs without closing the shared browser
+        await session.reset()
+    raw = result.final_result() if hasattr(result, 'final_result') else str(result)
+    return raw or ""
+
+
+async def _extract(task: str, port: int, max_steps: int, parse,
+                   max_actions_per_step: int = 15, page=None):
+    """Run `task` on EXTRACTOR_MODEL (pinned to `page`, if given) and return parse(raw).
+
+    If parse raises RuntimeError the task is retried once on PLANNER_MODEL.
+    """
+    raw = await _run_agent(task, port, max_steps, EXTRACTOR_MODEL, max_actions_per_step, page)
+    try:
+        return parse(raw)
+    except RuntimeError as e:
+        if EXTRACTOR_MODEL == PLANNER_MODEL:
+            raise
+        # A logged-out page fails the same way on any model — don't pay for a retry
+        if page is not None:
+            check_logged_in(page)
+        print(f"{EXTRACTOR_MODEL} output unusable ({str(e).splitlines()[0]}) — "
+              f"retrying with {PLANNER_MODEL}...")
+    raw = await _run_agent(task, port, max_steps, PLANNER_MODEL, max_actions_per_step, page)
+    return parse(raw)
+
+
+async def fetch_experience(context, slug: str) -> Optional[dict]:
+    """Read the topmost Experience entry of /in/<slug>/ straight from the DOM.
+
+    Returns None when the section or entry can't be found, so the caller can
+    hand the profile to the agent instead.
+    """
+    page = await context.new_page()
+    try:
+        # Page-level, so enrich tabs in an unrouted (pooled) context are still
+        # trimmed while the context's other tabs keep the HTTP cache
+        await page.route("**/*", _block_unneeded)
+        await page.goto(f"https://www.linkedin.com/in/{slug}/", wait_until="domcontentloaded")
+        check_logged_in(page)
+        try:
+            await page.locator("#experience").scroll_into_view_if_needed(timeout=10000)
+        except PlaywrightTimeoutError:
+            return None
+        entry = await page.query_selector(EXPERIENCE_SELECTOR)
+        if entry is None:
+            return None
+        top = await entry.evaluate(_EXPERIENCE_JS)
+    finally:
+        await page.close()
+
+    if not top["title"]:
+        return None
+    # caption is ["Jan 2023 - Present · 2 yrs", "City, Country"]; either may be missing
+    caption = top["caption"]
+    dates = caption[0].split(" · ")[0] if caption else ""
+    start, _, end = dates.replace(" – ", " - ").partition(" - ")
+    return {
+        "job_title": top["title"].strip(),
+        "company": top["company"].split(" · ")[0].strip() if top["company"] else None,
+        "start_date": start.strip() or None,
+        "end_date": end.strip() or None,
+        "location": caption[1].strip() if len(caption) > 1 else None,
+    }
+
+
+async def enrich_profiles(profiles: list[dict], page, storage: dict, port: int,
+                          emit=None) -> int:
+    """Set latest_experience on every profile: DOM read first, agent fallback.
+
+    `emit(profile)` is called as soon as each profile is settled (in completion
+    order), so results can be saved while the rest are still running.
+    Returns how many profiles were enriched.
+    """
+    emit = emit or (lambda profile: None)
+
+    def settle(profile: dict, exp: Optional[dict]) -> None:
+        profile["latest_experience"] = exp if isinstance(exp, dict) else None
+        emit(profile)
+
+    async def read_dom(profile: dict):
+        async with PAGE_SEM:
+            try:
+                return profile, await fetch_experience(page.context, profile["linkedin_id"])
+            except SessionExpiredError:
+                raise
+            except Exception:
+                return profile, None
+
+    async def read_agent(batch: list[dict]):
+        try:
+            res = await enrich_batch(batch, page.context.browser, storage, port)
+        except Exception as exc:
+            ids = ", ".join(p["linkedin_id"] for p in batch)
+            print(f"  enrich failed for {ids}: {exc}")
+            res = {}
+        return batch, res
+
+    # No id means no URL to visit
+    for profile in profiles:
+        if not profile.get("linkedin_id"):
+            settle(profile, None)
+
+    missing = []
+    reads = [asyncio.ensure_future(read_dom(p)) for p in profiles if p.get("linkedin_id")]
+    try:
+        for done in asyncio.as_completed(reads):
+            profile, exp = await done
+            if exp:
+                settle(profile, exp)
+            else:
+                missing.append(profile)
+    finally:
+        # SessionExpiredError aborts the run; don't leave the other reads loading
+        for task in reads:
+            task.cancel()
+
+    if missing:
+        batches = [missing[i:i + ENRICH_BATCH_SIZE]
+                   for i in range(0, len(missing), ENRICH_BATCH_SIZE)]
+        print(f"  DOM read failed for {len(missing)} profiles — "
+              f"falling back to the agent in {len(batches)} batch(es).")
+        for done in asyncio.as_completed([read_agent(b) for b in batches]):
+            batch, res = await done
+            for profile in batch:
+                settle(profile, res.get(profile["linkedin_id"]))
+
+    return sum(1 for p in profiles if p["latest_experience"])
+
+
+async def enrich_batch(profiles: list[dict], browser, storage: dict, port: int) -> dict:
+    """Fetch the latest experience entry for a batch of profiles in one context.
+
+    Returns {linkedin_id: experience} (empty if the agent output was unusable).
+    """
+    # The context is only opened once an agent slot is held, so batches queued
+    # behind AGENT_SEM don't sit on idle contexts (and their cookies and pages)
+    async with AGENT_SEM:
+        context = await _new_context(browser, storage)
+        try:
+            # Open the first profile up front and pin the agent to this tab, so
+            # concurrent batches never drive each other's pages
+            page = await context.new_page()
+            await page.goto(profiles[0]["linkedin_url"], wait_until="domcontentloaded")
+            # Each profile needs ~3 steps (navigate, scroll, read) → budget generously
+            raw = await _drive_agent(build_enrich_task(profiles), port,
+                                     max_steps=max(8, len(profiles) * 4),
+                                     model=EXTRACTOR_MODEL, max_actions_per_step=10,
+                                     page=page)
+        finally:
+            await context.close()
+    return parse_enrich_output(raw)
 
 
 def validate_linkedin_url(url: str) -> None:
     """Raise ValueError if url doesn't look like a LinkedIn profile URL."""
-    if not re.match(r'https?://(www\.)?linkedin\.com/in/[^/?#]+', url):
+    if not _RE_PROFILE.match(url):
         raise ValueError(
             f"Invalid LinkedIn profile URL: {url!r}\n"
             "Expected format: https://www.linkedin.com/in/username"
         )
 
 
+def print_summary(data: dict) -> None:
+    """Print a mutuals result (also used by the --use-daemon client)."""
+    print(f"\nMutual count : {data.get('mutual_count', '?')}")
+    print(f"Extracted    : {data.get('actual_extracted', '?')}")
+    for i, person in enumerate(data.get("mutual_connections", []), 1):
+        exp = person.get("latest_experience")
+        exp_str = f'  [{exp["job_title"]} @ {exp["company"]}]' if exp else ""
+        print(f"  {i:2}. {person['name']:<35}{exp_str}")
+
+
 async def get_mutual_connections(profile_url: str, save_path: Optional[str] = None,
-                                  enrich: bool = False) -> dict:
+                                  enrich: bool = False, context=None,
+                                  port: Optional[int] = None) -> dict:
     validate_linkedin_url(profile_url)
     print(f"\nTarget : {profile_url}")
     storage = load_storage()
 
-    # ── Phase 1: extract mutual connections list ──────────────────────────────
-    pw, browser, page, port = await _launch_browser(storage)
-    llm = ChatGoogle(model=MODEL, temperature=0)
+    def parse_mutuals(raw: str) -> dict:
+        data = parse_output(raw, profile_url)
+        if "error" in data:
+            raise RuntimeError(
+                f"Agent returned unparseable output: {data['error']}\n"
+                f"Raw output: {str(data.get('raw', ''))[:300]}"
+            )
+        return data
 
-    try:
-        agent = Agent(
-            task=build_task(profile_url),
-            llm=llm,
-            browser=BrowserSession(cdp_url=f"http://localhost:{port}"),
-            max_actions_per_step=15,
-        )
+    # One browser serves both phases — relaunching Chromium for Phase 2 would
+    # repeat the cold start, cookie injection and session check for nothing.
+    async with _open_page(storage, context, port) as (page, port):
+        # ── Phase 1: extract mutual connections list ──────────────────────────
         print("Phase 1 — extracting mutual connections list...\n")
-        result = await agent.run(max_steps=40)
-        raw = result.final_result() if hasattr(result, 'final_result') else str(result)
-    finally:
-        await browser.close()
-        await pw.stop()
-
-    data = parse_output(raw, profile_url)
-    if "error" in data:
-        raise RuntimeError(
-            f"Agent returned unparseable output: {data['error']}\n"
-            f"Raw output: {str(data.get('raw', ''))[:300]}"
-        )
-    print(f"\nMutual count : {data.get('mutual_count', '?')}")
-    print(f"Extracted    : {data.get('actual_extracted', '?')}")
+        data = await _extract(build_task(profile_url), port, 40, parse_mutuals, page=page)
 
-    # ── Phase 2 (optional): visit each profile for top experience entry ───────
-    if enrich and data.get("mutual_connections"):
+        # People are written as they're settled, so a long enrich run that dies
+        # part-way still leaves everything finished so far in save_path (in
+        # completion order; a run that finishes rewrites it in page order below)
         profiles = data["mutual_connections"]
-        print(f"\n⚠️  --enrich: will visit {len(profiles)} profiles one by one — this is slow.")
-        print(f"Phase 2 — enriching {len(profiles)} profiles with latest experience...")
-
-        pw2, browser2, page2, port2 = await _launch_browser(storage)
+        head = {k: v for k, v in data.items() if k != "mutual_connections"}
+        out = JsonStreamWriter(save_path, head, "mutual_connections") if save_path else None
         try:
-            # Each profile needs ~3 steps (navigate, scroll, read) → budget generously
-            max_steps = max(60, len(profiles) * 4)
-            agent2 = Agent(
-                task=build_enrich_task(profiles),
-                llm=llm,
-                browser=BrowserSession(cdp_url=f"http://localhost:{port2}"),
-                max_actions_per_step=15,
-            )
-            result2 = await agent2.run(max_steps=max_steps)
-            raw2 = result2.final_result() if hasattr(result2, 'final_result') else str(result2)
+            # ── Phase 2 (optional): visit each profile for top experience entry ──
+            if enrich and profiles:
+                print(f"\n--enrich: visiting {len(profiles)} profiles in parallel.")
+                print(f"Phase 2 — enriching {len(profiles)} profiles with latest experience...")
+                enriched = await enrich_profiles(profiles, page, storage, port,
+                                                 emit=out.write if out else None)
+                print(f"Enriched {enriched}/{len(profiles)} profiles with experience data")
+            elif out:
+                for person in profiles:
+                    out.write(person)
         finally:
-            await browser2.close()
-            await pw2.stop()
-
-        experience_map = parse_enrich_output(raw2)
-        enriched = 0
-        for person in data["mutual_connections"]:
-            lid = person.get("linkedin_id", "")
-            exp = experience_map.get(lid)
-            if exp and isinstance(exp, dict):
-                person["latest_experience"] = exp
-                enriched += 1
-            else:
-                person["latest_experience"] = None
-        print(f"Enriched {enriched}/{len(profiles)} profiles with experience data")
-
-    # ── Print summary ─────────────────────────────────────────────────────────
-    for i, person in enumerate(data.get("mutual_connections", []), 1):
-        exp = person.get("latest_experience")
-        exp_str = f'  [{exp["job_title"]} @ {exp["company"]}]' if exp else ""
-        print(f"  {i:2}. {person['name']:<35}{exp_str}")
+            if out:
+                out.close()
+        if out and enrich and profiles:
+            save_json(data, save_path)
 
+    print_summary(data)
     if save_path:
-        with open(save_path, "w") as f:
-            json.dump(data, f, indent=2)
         print(f"\nSaved to {save_path}")
 
     return data
@@ -318,7 +731,14 @@ def main():
     parser.add_argument("--save",   default=None,  help="Save results to JSON file")
     parser.add_argument("--enrich", action="store_true",
                         help="Also fetch latest experience entry from each profile")
+    parser.add_argument("--use-daemon", action="store_true",
+                        help="Run on a warm linkedin_daemon.py instead of launching a browser")
     args = parser.parse_args()
+    if args.use_daemon:
+        from linkedin_daemon import run_via_daemon
+        asyncio.run(run_via_daemon("mutuals", args.save, print_summary,
+                                   url=args.url, enrich=args.enrich))
+        return
     asyncio.run(get_mutual_connections(args.url, args.save, enrich=args.enrich))
 
 